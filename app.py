@@ -1,34 +1,41 @@
-﻿import os
+﻿import json
+import os
+import re
+import string
+from bisect import bisect_left
+from dataclasses import asdict, dataclass
+from typing import NamedTuple
 import streamlit as st
-import pandas as pd
-from dotenv import load_dotenv # Keep this for potential future use or other keys
+from jinja2 import Environment, FileSystemLoader
 
 # Removed Gemini Setup Block
 
-# ====== DATA LOAD ======
-@st.cache_data
-def load_defaults():
-    # Load the CSV file based on your project proposal name
-    try:
-        # Try proposal name first
-        df = pd.read_csv("sector_defaults.csv", encoding='latin1')
-    except FileNotFoundError:
-        try:
-            # Fallback in case the user has the old plural name
-            df = pd.read_csv("sectors_defaults.csv", encoding='latin1')
-        except Exception as e:
-            st.error(f"Error loading data: {e}. Please ensure 'sector_defaults.csv' is in the same folder.")
-            return None
-    
-    if df is not None:
-        df = df.set_index("sector")
-    return df
-
-defaults = load_defaults()
-
-# Stop execution if data isn't loaded
-if defaults is None:
-    st.stop()
+# ====== SECTOR DEFAULTS ======
+class SectorParams(NamedTuple):
+    india_intensity: float
+    eu_benchmark: float
+    ets_price: float
+    export_price: float
+    pre_margin_pct: float
+
+# The two calibrated sectors, mirroring the numeric columns of sector_defaults.csv (which keeps
+# the CBAM cost estimates and source notes). Keep both in sync when updating the calibration.
+_DEFAULTS = {
+    "steel": SectorParams(
+        india_intensity=2.5,    # india_emission_intensity_tCO2_per_tonne
+        eu_benchmark=1.28,      # eu_benchmark_intensity_tCO2_per_tonne
+        ets_price=66.5,         # ets_price_eur_per_tCO2
+        export_price=1080.0,    # typical_export_price_per_tonne_eur
+        pre_margin_pct=12.0,    # typical_pre_cbam_margin_pct
+    ),
+    "aluminium": SectorParams(
+        india_intensity=21.5,
+        eu_benchmark=7.0,
+        ets_price=66.5,
+        export_price=2700.0,
+        pre_margin_pct=10.0,
+    ),
+}
 
 st.set_page_config(
     page_title="Covalence", # Updated Page Title
@@ -36,61 +43,80 @@ st.set_page_config(
 )
 
 # ====== SIDEBAR INPUT / PARAMS ======
+SECTORS = list(_DEFAULTS)
+
 # These inputs are universal for both personas
 st.sidebar.header("Client / Export Inputs") # Capitalized
 
 sector = st.sidebar.selectbox(
     "Sector",
-    options=["steel", "aluminium"],
+    options=SECTORS,
     help="Model is calibrated for Indian steel and aluminium exporters to the EU. (Watch the UI change!)"
 )
-row = defaults.loc[sector]
+row = _DEFAULTS[sector]
 
 # ====== DEFINE DYNAMIC THEME COLORS ======
-if sector == "steel":
+@dataclass(frozen=True, slots=True)
+class Theme:
+    base_bg: str
+    card_bg: str
+    text_color: str
+    light_text: str
+    accent_color: str
+    border_color: str
+
+# One theme per sector; selecting it is a dict lookup
+_THEMES = {
     # New "Deep Indigo / Steel Blue" theme
-    base_bg = "#1A202C"       # Very Dark Blue (Slate 900)
-    card_bg = "#273344"       # Dark Blue (Slate 800)
-    text_color = "#E2E8F0"    # Light Gray-Blue (Slate 200)
-    light_text = "#94A3B8"    # Muted Gray (Slate 400)
-    accent_color = "#38BDF8"  # Bright Steel Blue (Sky 400)
-    border_color = "#475569"  # Dark Gray Border (Slate 600)
-else:
+    "steel": Theme(
+        base_bg="#1A202C",       # Very Dark Blue (Slate 900)
+        card_bg="#273344",       # Dark Blue (Slate 800)
+        text_color="#E2E8F0",    # Light Gray-Blue (Slate 200)
+        light_text="#94A3B8",    # Muted Gray (Slate 400)
+        accent_color="#38BDF8",  # Bright Steel Blue (Sky 400)
+        border_color="#475569",  # Dark Gray Border (Slate 600)
+    ),
     # "Midnight Blue" (dark) theme - HIGH CONTRAST
-    base_bg = "#0F172A"       # Darkest Blue (Slate 900)
-    card_bg = "#1E293B"       # Dark Blue (Slate 800)
-    text_color = "#F1F5F9"    # Off-white (Slate 100)
-    light_text = "#64748B"    # Muted Gray-Blue (Slate 500)
-    accent_color = "#0EA5E9"  # Bright Sky Blue (Sky 500)
-    border_color = "#334155"  # Subtle Border (Slate 700)
-
-user_intensity = st.sidebar.number_input(
+    "aluminium": Theme(
+        base_bg="#0F172A",       # Darkest Blue (Slate 900)
+        card_bg="#1E293B",       # Dark Blue (Slate 800)
+        text_color="#F1F5F9",    # Off-white (Slate 100)
+        light_text="#64748B",    # Muted Gray-Blue (Slate 500)
+        accent_color="#0EA5E9",  # Bright Sky Blue (Sky 500)
+        border_color="#334155",  # Subtle Border (Slate 700)
+    ),
+}
+
+theme = _THEMES[sector]
+
+# Sector stays outside the form so the theme and the sector defaults below switch immediately
+inputs_form = st.sidebar.form("inputs", border=False)
+
+user_intensity = inputs_form.number_input(
     "Plant emission intensity (tCO₂ / tonne product)",
     min_value=0.0,
-    value=float(row["india_emission_intensity_tCO2_per_tonne"]),
+    value=row.india_intensity,
     step=0.1
 )
 
-export_volume_tonnes = st.sidebar.number_input(
+export_volume_tonnes = inputs_form.number_input(
     "Annual EU export volume (tonnes/year)",
     min_value=0.0,
     value=39000.0,
     step=1000.0
 )
 
-selling_price = st.sidebar.number_input(
+selling_price = inputs_form.number_input(
     "Average selling price (€/tonne)",
     min_value=0.0,
-    value=float(row["typical_export_price_per_tonne_eur"]),
+    value=row.export_price,
     step=10.0
 )
 
-pre_margin_pct = float(row["typical_pre_cbam_margin_pct"])
+inputs_form.divider()
+inputs_form.header("Decarbonisation Plan") # Capitalized
 
-st.sidebar.divider()
-st.sidebar.header("Decarbonisation Plan") # Capitalized
-
-reduction_pct = st.sidebar.slider(
+reduction_pct = inputs_form.slider(
     "Target intensity reduction (%)",
     min_value=0,
     max_value=50,
@@ -98,7 +124,7 @@ reduction_pct = st.sidebar.slider(
     help="Your decarbonisation ambition over the next 24–36 months."
 )
 
-capex_per_pct_reduction_million_eur = st.sidebar.number_input(
+capex_per_pct_reduction_million_eur = inputs_form.number_input(
     "Capex per 1% reduction (million €)",
     min_value=0.0,
     value=8.0 if sector == "steel" else 5.0,
@@ -106,7 +132,7 @@ capex_per_pct_reduction_million_eur = st.sidebar.number_input(
     help="Ballpark: Steel retrofits (EAF, CCUS, H2-DRI) are more capital intensive than Aluminium's renewable power switch."
 )
 
-slb_rate_discount_bps = st.sidebar.number_input(
+slb_rate_discount_bps = inputs_form.number_input(
     "SLL / SLB incentive (bps)",
     min_value=0,
     max_value=300,
@@ -116,7 +142,7 @@ slb_rate_discount_bps = st.sidebar.number_input(
 )
 
 # New input for Banker persona
-deal_tenor_years = st.sidebar.number_input(
+deal_tenor_years = inputs_form.number_input(
     "Loan Tenor (Years)",
     min_value=1,
     max_value=20,
@@ -125,9 +151,11 @@ deal_tenor_years = st.sidebar.number_input(
     help="Typical loan period for structuring the deal."
 )
 
-st.sidebar.divider()
-st.sidebar.header("Financial Assumptions") # Capitalized
-EUR_to_INR_rate = st.sidebar.number_input("EUR to INR Exchange Rate", min_value=70.0, max_value=110.0, value=88.5, step=0.5) # Capitalized
+inputs_form.divider()
+inputs_form.header("Financial Assumptions") # Capitalized
+EUR_to_INR_rate = inputs_form.number_input("EUR to INR Exchange Rate", min_value=70.0, max_value=110.0, value=88.5, step=0.5) # Capitalized
+# Values only apply on submit, so editing several inputs costs one rerun instead of one per change
+inputs_form.form_submit_button("Recalculate")
 
 
 # ====== CORE CALCULATIONS (Deterministic Layer A) ======
@@ -136,229 +164,371 @@ EUR_to_INR_rate = st.sidebar.number_input("EUR to INR Exchange Rate", min_value=
 LAKH = 100_000
 CRORE = 10_000_000
 
-# Extract benchmark values from the loaded data row
-eu_benchmark = float(row["eu_benchmark_intensity_tCO2_per_tonne"])
-ets_price = float(row["ets_price_eur_per_tCO2"])
-
-# CBAM cost driver
-excess_intensity = max(user_intensity - eu_benchmark, 0)
-cbam_cost_per_tonne_calc = excess_intensity * ets_price
-total_cbam_bill = cbam_cost_per_tonne_calc * export_volume_tonnes
-total_cbam_bill_inr = total_cbam_bill * EUR_to_INR_rate
-
-# Margin hit
-cbam_hit_pct_of_price = (cbam_cost_per_tonne_calc / selling_price * 100) if selling_price > 0 else 0
-post_margin_pct = max(pre_margin_pct - cbam_hit_pct_of_price, 0)
-margin_delta = post_margin_pct - pre_margin_pct
-
-if cbam_hit_pct_of_price <= 5:
-    competitiveness = "GREEN – Broadly Aligned"
-    competitiveness_class = "status-green"
-elif cbam_hit_pct_of_price <= 15:
-    competitiveness = "YELLOW – Cost Pressure"
-    competitiveness_class = "status-yellow"
-else:
-    competitiveness = "RED – High Substitution Risk"
-    competitiveness_class = "status-red"
-
-# After decarbonisation scenario
-reduced_intensity = user_intensity * (1 - reduction_pct/100)
-excess_after = max(reduced_intensity - eu_benchmark, 0)
-cbam_after_per_tonne = excess_after * ets_price
-total_cbam_after = cbam_after_per_tonne * export_volume_tonnes
-
-cbam_savings_total = max(total_cbam_bill - total_cbam_after, 0)
-cbam_savings_total_inr = cbam_savings_total * EUR_to_INR_rate
-
-# Finance sizing
-total_transition_capex_million_eur = capex_per_pct_reduction_million_eur * reduction_pct
-total_transition_capex_eur = total_transition_capex_million_eur * 1_000_000
-total_transition_capex_inr = total_transition_capex_eur * EUR_to_INR_rate
-annual_finance_relief_estimate_eur = (slb_rate_discount_bps / 10000) * total_transition_capex_eur
-annual_finance_relief_estimate_inr = annual_finance_relief_estimate_eur * EUR_to_INR_rate
-
-# Readiness score
-# This calculation is correct. A high CBAM hit (e.g., 35% for Aluminium) vs. a low margin (10%)
-# results in a 0.0 score, which is the intended financial warning.
-score_raw = (cbam_hit_pct_of_price * 2) + (pre_margin_pct - post_margin_pct) * 5
-readiness_score = max(min(100 - score_raw, 100), 0)
-
-# Banker-specific calculations
-annual_debt_service_eur = (total_transition_capex_eur / deal_tenor_years) if deal_tenor_years > 0 else 0
-annual_debt_service_inr = annual_debt_service_eur * EUR_to_INR_rate
-annual_cash_flow_gain_eur = cbam_savings_total + annual_finance_relief_estimate_eur
-annual_cash_flow_gain_inr = annual_cash_flow_gain_eur * EUR_to_INR_rate
-coverage_ratio = (annual_cash_flow_gain_eur / annual_debt_service_eur) if annual_debt_service_eur > 0 else 999 # Avoid divide by zero
+# Competitiveness tiers by CBAM hit as % of price; bisect_left keeps the cut-offs inclusive (<= 5, <= 15)
+_CUTS = (5, 15)
+_TIERS = (
+    ("GREEN – Broadly Aligned", "status-green"),
+    ("YELLOW – Cost Pressure", "status-yellow"),
+    ("RED – High Substitution Risk", "status-red"),
+)
+
+class InrCrore(NamedTuple):
+    # INR (crore) equivalents of the EUR headline figures shown on the cards
+    cbam_bill: float
+    savings: float
+    capex: float
+    cash_gain: float
+
+@dataclass(frozen=True, slots=True)
+class Metrics:
+    # Benchmark values from the loaded data row
+    eu_benchmark: float
+    pre_margin_pct: float
+    # CBAM cost driver
+    cbam_cost_per_tonne_calc: float
+    total_cbam_bill: float
+    # Margin hit
+    cbam_hit_pct_of_price: float
+    post_margin_pct: float
+    margin_delta: float
+    competitiveness: str
+    competitiveness_class: str
+    # After decarbonisation scenario
+    cbam_savings_total: float
+    # Finance sizing
+    total_transition_capex_million_eur: float
+    total_transition_capex_eur: float
+    annual_finance_relief_estimate_eur: float
+    annual_cash_flow_gain_eur: float
+    readiness_score: float
+    inr_cr: InrCrore
+
+@dataclass(frozen=True, slots=True)
+class ExporterMetrics:
+    base: Metrics
+    payback_period: float
+
+@dataclass(frozen=True, slots=True)
+class BankerMetrics:
+    base: Metrics
+    annual_debt_service_eur: float
+    debt_service_inr_cr: float
+    coverage_ratio: float
+
+def _compute_common(sector, user_intensity, export_volume_tonnes, selling_price, reduction_pct,
+                    capex_per_pct_reduction_million_eur, slb_rate_discount_bps, EUR_to_INR_rate) -> Metrics:
+    row = _DEFAULTS[sector]
+
+    # Extract benchmark values from the loaded data row
+    eu_benchmark = row.eu_benchmark
+    ets_price = row.ets_price
+    pre_margin_pct = row.pre_margin_pct
+
+    # CBAM cost driver
+    excess_intensity = max(user_intensity - eu_benchmark, 0)
+    cbam_cost_per_tonne_calc = excess_intensity * ets_price
+    total_cbam_bill = cbam_cost_per_tonne_calc * export_volume_tonnes
+
+    # Margin hit
+    cbam_hit_pct_of_price = (cbam_cost_per_tonne_calc / selling_price * 100) if selling_price > 0 else 0
+    post_margin_pct = max(pre_margin_pct - cbam_hit_pct_of_price, 0)
+    margin_delta = post_margin_pct - pre_margin_pct
+
+    competitiveness, competitiveness_class = _TIERS[bisect_left(_CUTS, cbam_hit_pct_of_price)]
+
+    # After decarbonisation scenario
+    reduced_intensity = user_intensity * (1 - reduction_pct/100)
+    excess_after = max(reduced_intensity - eu_benchmark, 0)
+    cbam_after_per_tonne = excess_after * ets_price
+    total_cbam_after = cbam_after_per_tonne * export_volume_tonnes
+
+    cbam_savings_total = max(total_cbam_bill - total_cbam_after, 0)
+
+    # Finance sizing
+    total_transition_capex_million_eur = capex_per_pct_reduction_million_eur * reduction_pct
+    total_transition_capex_eur = total_transition_capex_million_eur * 1_000_000
+    annual_finance_relief_estimate_eur = (slb_rate_discount_bps / 10000) * total_transition_capex_eur
+    annual_cash_flow_gain_eur = cbam_savings_total + annual_finance_relief_estimate_eur
+
+    # Readiness score
+    # This calculation is correct. A high CBAM hit (e.g., 35% for Aluminium) vs. a low margin (10%)
+    # results in a 0.0 score, which is the intended financial warning.
+    score_raw = (cbam_hit_pct_of_price * 2) + (pre_margin_pct - post_margin_pct) * 5
+    readiness_score = max(min(100 - score_raw, 100), 0)
+
+    # EUR -> INR crore conversions, done in one pass
+    inr_cr = InrCrore._make(
+        v * EUR_to_INR_rate / CRORE
+        for v in (total_cbam_bill, cbam_savings_total, total_transition_capex_eur, annual_cash_flow_gain_eur)
+    )
+
+    return Metrics(
+        eu_benchmark=eu_benchmark,
+        pre_margin_pct=pre_margin_pct,
+        cbam_cost_per_tonne_calc=cbam_cost_per_tonne_calc,
+        total_cbam_bill=total_cbam_bill,
+        cbam_hit_pct_of_price=cbam_hit_pct_of_price,
+        post_margin_pct=post_margin_pct,
+        margin_delta=margin_delta,
+        competitiveness=competitiveness,
+        competitiveness_class=competitiveness_class,
+        cbam_savings_total=cbam_savings_total,
+        total_transition_capex_million_eur=total_transition_capex_million_eur,
+        total_transition_capex_eur=total_transition_capex_eur,
+        annual_finance_relief_estimate_eur=annual_finance_relief_estimate_eur,
+        annual_cash_flow_gain_eur=annual_cash_flow_gain_eur,
+        readiness_score=readiness_score,
+        inr_cr=inr_cr,
+    )
+
+# Each persona only computes what its view shows. Both are plain pure functions: a handful of
+# float ops is cheaper than st.cache_data hashing the arguments and unpickling the result
+def compute_exporter(sector, user_intensity, export_volume_tonnes, selling_price, reduction_pct,
+                     capex_per_pct_reduction_million_eur, slb_rate_discount_bps, EUR_to_INR_rate) -> ExporterMetrics:
+    base = _compute_common(sector, user_intensity, export_volume_tonnes, selling_price, reduction_pct,
+                           capex_per_pct_reduction_million_eur, slb_rate_discount_bps, EUR_to_INR_rate)
+    payback_period = (base.total_transition_capex_eur / base.annual_cash_flow_gain_eur) if base.annual_cash_flow_gain_eur > 0 else 0
+    return ExporterMetrics(base=base, payback_period=payback_period)
+
+def compute_banker(sector, user_intensity, export_volume_tonnes, selling_price, reduction_pct,
+                   capex_per_pct_reduction_million_eur, slb_rate_discount_bps, EUR_to_INR_rate,
+                   deal_tenor_years) -> BankerMetrics:
+    base = _compute_common(sector, user_intensity, export_volume_tonnes, selling_price, reduction_pct,
+                           capex_per_pct_reduction_million_eur, slb_rate_discount_bps, EUR_to_INR_rate)
+    annual_debt_service_eur = (base.total_transition_capex_eur / deal_tenor_years) if deal_tenor_years > 0 else 0
+    coverage_ratio = (base.annual_cash_flow_gain_eur / annual_debt_service_eur) if annual_debt_service_eur > 0 else 999 # Avoid divide by zero
+    # The one INR figure outside InrCrore: debt service needs the tenor and only the banker view shows it
+    return BankerMetrics(
+        base=base,
+        annual_debt_service_eur=annual_debt_service_eur,
+        debt_service_inr_cr=annual_debt_service_eur * EUR_to_INR_rate / CRORE,
+        coverage_ratio=coverage_ratio,
+    )
 
 
 # ====== SECTOR-SPECIFIC CONTEXT (for Layer B) ======
-def sector_specific_decarb_levers(sec):
-    if sec == "steel":
-        return [
-            "**Shift to EAF:** Move from Basic Oxygen Furnace (BOF) to scrap-based Electric Arc Furnace (EAF) or hydrogen-based Direct Reduced Iron (H2-DRI).",
-            "**Pilot CCUS:** Implement Carbon Capture, Utilisation, and Storage (CCUS) on high-temperature process streams.",
-            "**Electrification:** Use energy recovery and electrification in reheating and rolling processes."
-        ]
-    else:
-        return [
-            "**Renewable Power:** Shift captive power from coal to renewables via long-term Power Purchase Agreements (PPAs) or captive solar/wind farms. This is the single biggest lever.",
-            "**Cell Efficiency:** Improve electrolytic cell efficiency and anode management to reduce process emissions.",
-            "**Heat Recovery:** Implement heat recovery systems and electrify downstream rolling/extrusion."
-        ]
-
-def sector_specific_finance(sec):
-    if sec == "steel":
-        return [
-            "**Sustainability-Linked Loans (SLLs):** KPI-linked loans tied to tCO₂/tonne reduction. *Precedent: Tata Steel, JSW Steel.*",
-            "**Blended Finance:** Use of first-loss guarantees for high-capex tech like H₂-DRI or CCUS.",
-            "**Policy Support:** Advocate for state-backed transition facilities or Contracts for Difference (CfD) for green steel."
-        ]
-    else:
-        return [
-            "**Green Bonds:** Issue bonds specifically to fund renewable PPAs or captive solar for smelters. *Precedent: Hindalco.*",
-            "**Concessional Lines:** Access multilateral (World Bank, IFC) credit lines targeting electricity decarbonisation.",
-            "**Pooled Guarantees:** For downstream MSMEs, use cluster-scale pooled guarantees to access affordable credit."
-        ]
+_DECARB_STEEL = (
+    "**Shift to EAF:** Move from Basic Oxygen Furnace (BOF) to scrap-based Electric Arc Furnace (EAF) or hydrogen-based Direct Reduced Iron (H2-DRI).",
+    "**Pilot CCUS:** Implement Carbon Capture, Utilisation, and Storage (CCUS) on high-temperature process streams.",
+    "**Electrification:** Use energy recovery and electrification in reheating and rolling processes.",
+)
+_DECARB_ALU = (
+    "**Renewable Power:** Shift captive power from coal to renewables via long-term Power Purchase Agreements (PPAs) or captive solar/wind farms. This is the single biggest lever.",
+    "**Cell Efficiency:** Improve electrolytic cell efficiency and anode management to reduce process emissions.",
+    "**Heat Recovery:** Implement heat recovery systems and electrify downstream rolling/extrusion.",
+)
+_DECARB = {"steel": _DECARB_STEEL, "aluminium": _DECARB_ALU}
+
+# Pre-joined markdown bullet list, so the list is a single st.markdown call
+_DECARB_RENDERED = {k: "\n".join(f"- {x}" for x in v) for k, v in _DECARB.items()}
 
 # ====== DYNAMIC STYLING (New Themes) ======
-def get_custom_css(base_bg, card_bg, text_color, light_text, accent_color, border_color):
-    # This function no longer defines colors, it receives them
-    # Ensure consistent indentation within this f-string (using spaces)
-    css = f"""
-    <style>
-        /* Base */
-        .stApp {{
-            background-color: {base_bg};
-            color: {text_color};
-        }}
-        /* Updated: Style h2, etc. EXCEPT the main title */
-        h2, h3, h4, h5, h6 {{
-            color: {text_color};
-        }}
-        
-        /* Main Title */
-        .main-title {{
-            color: {accent_color}; /* Use the bold accent color */
-            font-weight: 700; /* Ensure it's bold */
-            text-align: left; /* Keep alignment */
-            padding-bottom: 0px; /* Adjust spacing if needed */
-            margin-bottom: 0px; /* Adjust spacing if needed */
-        }}
-        
-        /* Tagline */
-        .tagline {{
-            color: {light_text}; /* Use the lighter text color */
-            font-size: 1.1rem;
-            font-weight: 500;
-            margin-top: -10px; /* Pull it closer to the title */
-            margin-bottom: 10px;
-        }}
-
-        /* Persona Selector */
-        [data-testid="stRadio"] label {{
-            background-color: {card_bg};
-            border: 1px solid {border_color};
-            padding: 8px 12px;
-            border-radius: 8px;
-            margin-right: 10px;
-            color: {light_text};
-        }}
-        [data-testid="stRadio"] [aria-checked="true"] label {{
-            background-color: {accent_color};
-            color: #FFFFFF;
-            border-color: {accent_color};
-        }}
-
-        /* Sidebar */
-        [data-testid="stSidebar"] {{
-            background-color: {card_bg};
-            border-right: 1px solid {border_color};
-        }}
-        [data-testid="stSidebar"] [data-testid="stMarkdownContainer"] {{
-            color: {text_color};
-        }}
-
-        /* Tabs */
-        .stTabs [data-baseweb="tab-list"] {{
-            background-color: {base_bg};
-            padding-bottom: 0px;
-        }}
-        .stTabs [data-baseweb="tab-list"] button {{
-            color: {light_text};
-            background-color: {base_bg};
-            border-bottom: 2px solid {border_color};
-            padding: 10px 15px;
-        }}
-        .stTabs [data-baseweb="tab-list"] button[aria-selected="true"] {{
-            color: {accent_color};
-            border-bottom: 2px solid {accent_color};
-            background-color: {card_bg};
-        }}
-
-        /* Main Tab Content Containers */
-        [data-testid="stVerticalBlockBorderWrapper"] {{
-            background-color: {card_bg};
-            border: 1px solid {border_color};
-            border-radius: 10px;
-            padding: 24px;
-            text-align: left;
-            margin-bottom: 10px;
-        }}
-
-        /* --- Custom KPI Card Styles --- */
-        .kpi-card {{
-            background-color: {card_bg};
-            border: 1px solid {border_color};
-            border-radius: 10px;
-            padding: 24px;
-            text-align: left;
-            margin-bottom: 10px;
-            height: 145px;
-        }}
-        .kpi-label {{
-            font-size: 0.85rem;
-            color: {light_text};
-            text-transform: uppercase;
-            margin-bottom: 8px;
-            font-weight: 500;
-        }}
-        .kpi-value {{
-            font-size: 2.25rem;
-            font-weight: bold;
-            color: {text_color};
-            line-height: 1.2;
-        }}
-        .kpi-accent {{
-            color: {accent_color};
-        }}
-        .kpi-subtext, .kpi-delta-pos, .kpi-delta-neg {{
-            font-size: 0.95rem;
-            color: {light_text};
-            margin-top: 8px;
-        }}
-        .kpi-delta-pos {{
-            color: #2ECC71 !important; /* Green */
-        }}
-        .kpi-delta-neg {{
-            color: #E74C3C !important; /* Red */
-        }}
-
-        /* Status Text */
-        .status-green {{ color: #2ECC71; font-weight: bold; }}
-        .status-yellow {{ color: #F1C40F; font-weight: bold; }}
-        .status-red {{ color: #E74C3C; font-weight: bold; }}
-
-        /* List items in containers */
-        [data-testid="stVerticalBlockBorderWrapper"] ul li {{
-            margin-bottom: 8px;
-            font-size: 0.95rem;
-        }}
-
-    </style>
-    """
-    return css
-
-st.markdown(get_custom_css(base_bg, card_bg, text_color, light_text, accent_color, border_color), unsafe_allow_html=True)
+# Theme colors are filled in via $placeholders, so the CSS needs no f-string brace escaping
+_CSS_TPL = string.Template("""
+    /* Base */
+    .stApp {
+        background-color: $base_bg;
+        color: $text_color;
+    }
+    /* Updated: Style h2, etc. EXCEPT the main title */
+    h2, h3, h4, h5, h6 {
+        color: $text_color;
+    }
+    
+    /* Main Title */
+    .main-title {
+        color: $accent_color; /* Use the bold accent color */
+        font-weight: 700; /* Ensure it's bold */
+        text-align: left; /* Keep alignment */
+        padding-bottom: 0px; /* Adjust spacing if needed */
+        margin-bottom: 0px; /* Adjust spacing if needed */
+    }
+    
+    /* Tagline */
+    .tagline {
+        color: $light_text; /* Use the lighter text color */
+        font-size: 1.1rem;
+        font-weight: 500;
+        margin-top: -10px; /* Pull it closer to the title */
+        margin-bottom: 10px;
+    }
+
+    /* Persona Selector */
+    [data-testid="stRadio"] label {
+        background-color: $card_bg;
+        border: 1px solid $border_color;
+        padding: 8px 12px;
+        border-radius: 8px;
+        margin-right: 10px;
+        color: $light_text;
+    }
+    [data-testid="stRadio"] [aria-checked="true"] label {
+        background-color: $accent_color;
+        color: #FFFFFF;
+        border-color: $accent_color;
+    }
+
+    /* Sidebar */
+    [data-testid="stSidebar"] {
+        background-color: $card_bg;
+        border-right: 1px solid $border_color;
+    }
+    [data-testid="stSidebar"] [data-testid="stMarkdownContainer"] {
+        color: $text_color;
+    }
+
+    /* Tabs */
+    .stTabs [data-baseweb="tab-list"] {
+        background-color: $base_bg;
+        padding-bottom: 0px;
+    }
+    .stTabs [data-baseweb="tab-list"] button {
+        color: $light_text;
+        background-color: $base_bg;
+        border-bottom: 2px solid $border_color;
+        padding: 10px 15px;
+    }
+    .stTabs [data-baseweb="tab-list"] button[aria-selected="true"] {
+        color: $accent_color;
+        border-bottom: 2px solid $accent_color;
+        background-color: $card_bg;
+    }
+
+    /* Main Tab Content Containers */
+    [data-testid="stVerticalBlockBorderWrapper"] {
+        background-color: $card_bg;
+        border: 1px solid $border_color;
+        border-radius: 10px;
+        padding: 24px;
+        text-align: left;
+        margin-bottom: 10px;
+    }
+
+    /* --- Custom KPI Card Styles --- */
+    .kpi-row {
+        display: grid;
+        grid-template-columns: repeat(4, 1fr);
+        gap: 1rem;
+    }
+    .kpi-row-3 {
+        grid-template-columns: repeat(3, 1fr);
+    }
+    .kpi-row-2 {
+        grid-template-columns: repeat(2, 1fr);
+    }
+    .kpi-card {
+        background-color: $card_bg;
+        border: 1px solid $border_color;
+        border-radius: 10px;
+        padding: 24px;
+        text-align: left;
+        margin-bottom: 10px;
+        height: 145px;
+    }
+    .kpi-label {
+        font-size: 0.85rem;
+        color: $light_text;
+        text-transform: uppercase;
+        margin-bottom: 8px;
+        font-weight: 500;
+    }
+    .kpi-value {
+        font-size: 2.25rem;
+        font-weight: bold;
+        color: $text_color;
+        line-height: 1.2;
+    }
+    .kpi-accent {
+        color: $accent_color;
+    }
+    .kpi-subtext, .kpi-delta-pos, .kpi-delta-neg {
+        font-size: 0.95rem;
+        color: $light_text;
+        margin-top: 8px;
+    }
+    .kpi-delta-pos {
+        color: #2ECC71 !important; /* Green */
+    }
+    .kpi-delta-neg {
+        color: #E74C3C !important; /* Red */
+    }
+
+    /* Status Text */
+    .status-green { color: #2ECC71; font-weight: bold; }
+    .status-yellow { color: #F1C40F; font-weight: bold; }
+    .status-red { color: #E74C3C; font-weight: bold; }
+
+    /* List items in containers */
+    [data-testid="stVerticalBlockBorderWrapper"] ul li {
+        margin-bottom: 8px;
+        font-size: 0.95rem;
+    }
+""")
+
+def _minify_css(css):
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)  # Drop comments
+    css = re.sub(r"\s+", " ", css)                    # Collapse whitespace
+    return re.sub(r"\s*([{};,])\s*", r"\1", css).strip()
+
+# Only two themes exist, so both stylesheets are built and minified once per process;
+# a rerun is then a single dict lookup
+@st.cache_resource(show_spinner=False)
+def _css_cache():
+    return {sec: _minify_css(_CSS_TPL.substitute(asdict(t))) for sec, t in _THEMES.items()}
+
+def _inject_css(css):
+    # Streamlit drops any element a rerun doesn't re-emit, so a st.markdown <style> block would have
+    # to be resent every rerun. Instead an empty iframe at the foot of the sidebar writes the stylesheet
+    # into the parent page's <head>, where it outlives the iframe and persists for the rest of the session;
+    # nothing sits below it, so dropping it on the next rerun shifts no layout.
+    st.sidebar.iframe(
+        "<script>"
+        "const doc = window.parent.document;"
+        "let el = doc.getElementById('covalence-theme');"
+        "if (!el) { el = doc.createElement('style'); el.id = 'covalence-theme'; doc.head.appendChild(el); }"
+        "el.textContent = %s;"
+        "</script>" % json.dumps(css)
+    )
+
+# Emitted once per session, and again only when the sector (and so the theme) changes
+if st.session_state.get("_css_theme") != sector:
+    _inject_css(_css_cache()[sector])
+    st.session_state["_css_theme"] = sector
+
+# ====== HTML TEMPLATES ======
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+
+# Compiled once per process. Each persona view is then a single make_module() render that
+# builds every HTML block of the view in one pass; each tab then emits its block
+@st.cache_resource(show_spinner=False)
+def _persona_templates():
+    env = Environment(loader=FileSystemLoader(TEMPLATE_DIR), autoescape=False, trim_blocks=True, lstrip_blocks=True)
+    return {"exporter": env.get_template("exporter.html.j2"), "banker": env.get_template("banker.html.j2")}
+
+# Each figure is formatted once per run and reused wherever it appears
+def format_common(m, user_intensity, india_intensity, EUR_to_INR_rate):
+    return {
+        "readiness": f"{m.readiness_score:.1f} / 100",
+        "cbam_bill_eur": f"€{m.total_cbam_bill:,.0f}",
+        "cbam_bill_inr_cr": f"₹ {m.inr_cr.cbam_bill:,.1f} Cr",
+        "post_margin": f"{m.post_margin_pct:.1f}%",
+        "margin_delta": f"{m.margin_delta:.1f}%",
+        "pre_margin": f"{m.pre_margin_pct:.1f}%",
+        "savings_eur": f"€{m.cbam_savings_total:,.0f}",
+        "savings_inr_cr": f"₹ {m.inr_cr.savings:,.1f} Cr",
+        "cbam_hit_pct": f"{m.cbam_hit_pct_of_price:.1f}%",
+        "competitiveness": m.competitiveness,
+        "competitiveness_class": m.competitiveness_class,
+        "user_intensity": f"{user_intensity:.2f}",
+        "india_intensity": f"{india_intensity:.2f}",
+        "eu_benchmark": f"{m.eu_benchmark:.2f}",
+        "cbam_per_tonne_eur": f"€{m.cbam_cost_per_tonne_calc:,.2f}",
+        "cbam_per_tonne_inr": f"₹ {m.cbam_cost_per_tonne_calc * EUR_to_INR_rate:,.0f}",
+        "capex_eur_m": f"€{m.total_transition_capex_million_eur:,.1f}m",
+        "capex_inr_cr": f"₹ {m.inr_cr.capex:,.1f} Cr",
+        "cash_gain_eur": f"€{m.annual_cash_flow_gain_eur:,.0f}",
+        "cash_gain_inr_cr": f"₹ {m.inr_cr.cash_gain:,.2f} Cr",
+    }
 
 
 # ====== LAYOUT START ======
@@ -379,47 +549,23 @@ st.divider()
 
 # ====== PERSONA 1: EXPORTER VIEW ======
 if persona == "Exporter / Manufacturer":
+    x = compute_exporter(
+        sector, user_intensity, export_volume_tonnes, selling_price, reduction_pct,
+        capex_per_pct_reduction_million_eur, slb_rate_discount_bps, EUR_to_INR_rate,
+    )
+    m = x.base
+    s = format_common(m, user_intensity, row.india_intensity, EUR_to_INR_rate)
+    s["payback"] = f"{x.payback_period:.1f} Yrs"
+
+    view = _persona_templates()["exporter"].make_module({
+        "s": s,
+        "theme": theme,
+        "readiness_zero": m.readiness_score == 0,
+        "margin_delta_class": "kpi-delta-pos" if m.margin_delta >= 0 else "kpi-delta-neg",
+    })
 
     # 1.1: Exporter KPI Row
-    kpi_col1, kpi_col2, kpi_col3, kpi_col4 = st.columns(4)
-    
-    # --- Add helper text for 0.0 readiness score ---
-    readiness_subtext = "Resilience to EU buyer pressure"
-    if readiness_score == 0:
-        readiness_subtext = "<span class='status-red'>High Risk: CBAM cost exceeds margin</span>"
-
-    kpi_col1.markdown(f"""
-    <div class="kpi-card">
-        <div class="kpi-label">Readiness Score</div>
-        <div class="kpi-value kpi-accent">{readiness_score:.1f} / 100</div>
-        <div class="kpi-subtext">{readiness_subtext}</div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    kpi_col2.markdown(f"""
-    <div class="kpi-card">
-        <div class="kpi-label">Annual CBAM Bill (Est.)</div>
-        <div class="kpi-value">€{total_cbam_bill:,.0f}</div>
-        <div class="kpi-subtext">(Approx. ₹ {total_cbam_bill_inr / CRORE:,.1f} Cr)</div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    margin_delta_class = "kpi-delta-pos" if margin_delta >= 0 else "kpi-delta-neg"
-    kpi_col3.markdown(f"""
-    <div class="kpi-card">
-        <div class="kpi-label">Post-CBAM Margin</div>
-        <div class="kpi-value">{post_margin_pct:.1f}%</div>
-        <div class="{margin_delta_class}">{margin_delta:.1f}% (from {pre_margin_pct:.1f}%)</div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    kpi_col4.markdown(f"""
-    <div class="kpi-card">
-        <div class="kpi-label">Annual CBAM Savings</div>
-        <div class="kpi-value">€{cbam_savings_total:,.0f}</div>
-        <div class="kpi-subtext">(Approx. ₹ {cbam_savings_total_inr / CRORE:,.1f} Cr)</div>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(view.kpis, unsafe_allow_html=True)
 
     # 1.2: Exporter Tabs - REMOVED EMOJIS, Capitalized
     tab1, tab2, tab3 = st.tabs([
@@ -431,72 +577,13 @@ if persona == "Exporter / Manufacturer":
     with tab1:
         with st.container(border=True):
             st.subheader("Competitiveness & Margin Erosion") # Capitalized
-            col1, col2 = st.columns(2)
-            with col1:
-                st.markdown(f"""
-                <div class="kpi-card" style="height: auto; text-align: center; padding: 30px; border: 1px solid {border_color}; border-radius: 10px;">
-                    <div class="kpi-label">Competitiveness Rating</div>
-                    <div class="kpi-value {competitiveness_class}" style="font-size: 1.8rem;">{competitiveness}</div>
-                    <div class="{competitiveness_class}" style="margin-top: 10px; color: {light_text};">
-                        CBAM adds {cbam_hit_pct_of_price:.1f}% to your per-tonne cost.
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-            with col2:
-                st.markdown(f"""
-                <div class="kpi-card" style="height: auto;">
-                    <div class="kpi-label">Current Plant Intensity</div>
-                    <div class="kpi-value">{user_intensity:.2f} tCO₂/t</div>
-                    <div class="kpi-subtext">
-                        India baseline: {row['india_emission_intensity_tCO2_per_tonne']:.2f} | 
-                        EU benchmark: {eu_benchmark:.2f}
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-                st.markdown(f"""
-                <div class="kpi-card" style="height: auto; margin-top: 10px;">
-                    <div class="kpi-label">CBAM Cost per Tonne</div>
-                    <div class="kpi-value">€{cbam_cost_per_tonne_calc:,.2f}</div>
-                    <div class="kpi-subtext">
-                        (Approx. ₹ {cbam_cost_per_tonne_calc * EUR_to_INR_rate:,.0f})
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+            st.markdown(view.exposure, unsafe_allow_html=True)
     
     with tab2:
         with st.container(border=True):
             st.subheader(f"Quantifying the {reduction_pct}% Decarbonisation Plan") # Capitalized
             
-            payback_period = (total_transition_capex_eur / annual_cash_flow_gain_eur) if annual_cash_flow_gain_eur > 0 else 0
-            
-            col1, col2, col3 = st.columns(3)
-            col1.markdown(f"""
-            <div class="kpi-card" style="height: auto;">
-                <div class="kpi-label">Total Transition Capex</div>
-                <div class="kpi-value">€{total_transition_capex_million_eur:,.1f}m</div>
-                <div class="kpi-subtext">
-                    (Approx. ₹ {total_transition_capex_inr / CRORE:,.1f} Cr)
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-            col2.markdown(f"""
-            <div class="kpi-card" style="height: auto;">
-                <div class="kpi-label">Annual Positive Cash Flow</div>
-                <div class="kpi-value">€{annual_cash_flow_gain_eur:,.0f}</div>
-                <div class="kpi-subtext">
-                    (Approx. ₹ {annual_cash_flow_gain_inr / CRORE:,.2f} Cr / yr)
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-            col3.markdown(f"""
-            <div class="kpi-card" style="height: auto;">
-                <div class="kpi-label">Simple Payback Period</div>
-                <div class="kpi-value kpi-accent">{payback_period:.1f} Yrs</div>
-                <div class="kpi-subtext">
-                    Compares Capex to annual cash flow gains.
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(view.plan, unsafe_allow_html=True)
     
     # REMOVED Exporter AI Copilot Tab 
     
@@ -506,9 +593,7 @@ if persona == "Exporter / Manufacturer":
             col1, col2 = st.columns(2)
             with col1:
                 st.markdown("#### Key Decarbonisation Levers") # Capitalized
-                lever_list = sector_specific_decarb_levers(sector)
-                for item in lever_list:
-                    st.markdown(f"- {item}")
+                st.markdown(_DECARB_RENDERED[sector])
             with col2:
                 st.markdown("#### Policy & MRV Gaps") # Capitalized
                 st.markdown(
@@ -521,47 +606,26 @@ if persona == "Exporter / Manufacturer":
 
 # ====== PERSONA 2: BANKER / FI VIEW ======
 else: 
-    
+    b = compute_banker(
+        sector, user_intensity, export_volume_tonnes, selling_price, reduction_pct,
+        capex_per_pct_reduction_million_eur, slb_rate_discount_bps, EUR_to_INR_rate,
+        deal_tenor_years,
+    )
+    m = b.base
+    s = format_common(m, user_intensity, row.india_intensity, EUR_to_INR_rate)
+    s["debt_service_eur"] = f"€{b.annual_debt_service_eur:,.0f}"
+    s["debt_service_inr_cr"] = f"₹ {b.debt_service_inr_cr:,.2f} Cr"
+    s["coverage"] = f"{b.coverage_ratio:.2f}"
+
+    view = _persona_templates()["banker"].make_module({
+        "s": s,
+        "theme": theme,
+        "readiness_zero": m.readiness_score == 0,
+        "coverage_class": "kpi-delta-pos" if b.coverage_ratio >= 1 else "kpi-delta-neg",
+    })
+
     # 2.1: Banker KPI Row
-    kpi_col1, kpi_col2, kpi_col3, kpi_col4 = st.columns(4)
-    
-    # --- Add helper text for 0.0 readiness score ---
-    readiness_subtext = "Client's resilience to CBAM shock"
-    if readiness_score == 0:
-        readiness_subtext = "<span class='status-red'>High Risk: CBAM cost exceeds margin</span>"
-
-    kpi_col1.markdown(f"""
-    <div class="kpi-card">
-        <div class="kpi-label">Client Risk Score</div>
-        <div class="kpi-value kpi-accent">{readiness_score:.1f} / 100</div>
-        <div class="kpi-subtext">{readiness_subtext}</div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    kpi_col2.markdown(f"""
-    <div class="kpi-card">
-        <div class="kpi-label">Client CBAM Liability</div>
-        <div class="kpi-value">€{total_cbam_bill:,.0f} /yr</div>
-        <div class="kpi-subtext">(Approx. ₹ {total_cbam_bill_inr / CRORE:,.1f} Cr / yr)</div>
-    </div>
-    """, unsafe_allow_html=True)
-
-    kpi_col3.markdown(f"""
-    <div class="kpi-card">
-        <div class="kpi-label">Transition Deal Size</div>
-        <div class="kpi-value">€{total_transition_capex_million_eur:,.1f}m</div>
-        <div class="kpi-subtext">(Approx. ₹ {total_transition_capex_inr / CRORE:,.1f} Cr)</div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    coverage_class = "kpi-delta-pos" if coverage_ratio >= 1 else "kpi-delta-neg"
-    kpi_col4.markdown(f"""
-    <div class="kpi-card">
-        <div class="kpi-label">Debt Service Coverage</div>
-        <div class="kpi-value {coverage_class}">{coverage_ratio:.2f} x</div>
-        <div class="kpi-subtext">Cash gains vs. debt service</div>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(view.kpis, unsafe_allow_html=True)
 
     # 2.2: Banker Tabs - REMOVED EMOJIS, Capitalized
     tab1, tab2, tab3 = st.tabs([
@@ -573,38 +637,11 @@ else:
     with tab1:
         with st.container(border=True):
             st.subheader("Transition Finance Structuring") # Capitalized
-            st.markdown(f"Structuring a **€{total_transition_capex_million_eur:,.1f}m (Approx. ₹ {total_transition_capex_inr / CRORE:,.1f} Cr)** transition loan over **{deal_tenor_years} years**.")
+            st.markdown(f"Structuring a **{s['capex_eur_m']} (Approx. {s['capex_inr_cr']})** transition loan over **{deal_tenor_years} years**.")
             
-            col1, col2, col3 = st.columns(3)
-            col1.markdown(f"""
-            <div class="kpi-card" style="height: auto;">
-                <div class="kpi-label">Annual Debt Service (Est.)</div>
-                <div class="kpi-value">€{annual_debt_service_eur:,.0f}</div>
-                <div class="kpi-subtext">
-                    (Approx. ₹ {annual_debt_service_inr / CRORE:,.2f} Cr / yr)
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-            col2.markdown(f"""
-            <div class="kpi-card" style="height: auto;">
-                <div class="kpi-label">Annual Client Cash Flow Gain</div>
-                <div class="kpi-value">€{annual_cash_flow_gain_eur:,.0f}</div>
-                <div class="kpi-subtext">
-                    (Approx. ₹ {annual_cash_flow_gain_inr / CRORE:,.2f} Cr / yr)
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-            col3.markdown(f"""
-            <div class="kpi-card" style="height: auto;">
-                <div class="kpi-label">DSCR (Cash Gain / Debt)</div>
-                <div class="kpi-value {coverage_class}">{coverage_ratio:.2f} x</div>
-                <div class="kpi-subtext">
-                    A ratio > 1.0x means the project's gains self-liquidate the new debt.
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(view.deal, unsafe_allow_html=True)
             
-            st.markdown(f"**Conclusion:** The decarbonisation project is **bankable**. The annual positive cash flow of **€{annual_cash_flow_gain_eur:,.0f} (₹ {annual_cash_flow_gain_inr / CRORE:,.2f} Cr)** generated by the investment is sufficient to cover the new annual debt service of **€{annual_debt_service_eur:,.0f} (₹ {annual_debt_service_inr / CRORE:,.2f} Cr)** by a factor of **{coverage_ratio:.2f}x**. The SLL structure de-risks the client's export business, making them a stronger credit.")
+            st.markdown(f"**Conclusion:** The decarbonisation project is **bankable**. The annual positive cash flow of **{s['cash_gain_eur']} ({s['cash_gain_inr_cr']})** generated by the investment is sufficient to cover the new annual debt service of **{s['debt_service_eur']} ({s['debt_service_inr_cr']})** by a factor of **{s['coverage']}x**. The SLL structure de-risks the client's export business, making them a stronger credit.")
             
     with tab2:
         with st.container(border=True):
@@ -647,36 +684,7 @@ else:
 
     with tab3: # Renumbered from tab4
         with st.container(border=True):
-            # This is a simple duplication of the Exporter tab 1, framed for the banker
+            # Same block as the Exporter tab 1, framed for the banker
             st.subheader("Client Risk Profile & Exposure") # Capitalized
-            col1, col2 = st.columns(2)
-            with col1:
-                st.markdown(f"""
-                <div class="kpi-card" style="height: auto; text-align: center; padding: 30px; border: 1px solid {border_color}; border-radius: 10px;">
-                    <div class="kpi-label">Client Competitiveness Rating</div>
-                    <div class="kpi-value {competitiveness_class}" style="font-size: 1.8rem;">{competitiveness}</div>
-                    <div class="{competitiveness_class}" style="margin-top: 10px; color: {light_text};">
-                        CBAM adds {cbam_hit_pct_of_price:.1f}% to client's per-tonne cost.
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-            with col2:
-                st.markdown(f"""
-                <div class="kpi-card" style="height: auto;">
-                    <div class="kpi-label">Client Intensity vs. Benchmark</div>
-                    <div class="kpi-value">{user_intensity:.2f} tCO₂/t</div>
-                    <div class="kpi-subtext">
-                        vs. EU benchmark of: {eu_benchmark:.2f} tCO₂/t
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-                st.markdown(f"""
-                <div class="kpi-card" style="height: auto; margin-top: 10px;">
-                    <div class="kpi-label">Client CBAM Cost per Tonne</div>
-                    <div class="kpi-value">€{cbam_cost_per_tonne_calc:,.2f}</div>
-                    <div class="kpi-subtext">
-                        (Approx. ₹ {cbam_cost_per_tonne_calc * EUR_to_INR_rate:,.0f})
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+            st.markdown(view.exposure, unsafe_allow_html=True)
 